@@ -4,21 +4,82 @@ Data Analysis Utility for Scraped Startup Data
 Provides statistics and insights from the scraped startup data.
 """
 
-import json
+import orjson
 from pathlib import Path
 from collections import Counter
-from typing import List, Dict
+from itertools import chain
+from typing import List, Dict, Iterable, Iterator
 
+# Shared read-only fallback for missing nested objects (location, contact),
+# so lookups on records without them don't allocate a fresh dict each time
+_EMPTY: Dict = {}
 
-def load_data(file_path: str = "startups_data.json") -> List[Dict]:
-    """Load scraped startup data."""
-    with open(file_path, "r") as f:
-        return json.load(f)
 
+def iter_startups(file_path: str = "startups_data.jsonl") -> Iterator[Dict]:
+    """Stream scraped startup data one record at a time (one JSON object per line)."""
+    with open(file_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
 
-def analyze_data(data: List[Dict]):
+
+def load_data(file_path: str = "startups_data.jsonl") -> List[Dict]:
+    """Load all scraped startup data into memory."""
+    return list(iter_startups(file_path))
+
+
+def analyze_data(data: Iterable[Dict]):
     """Analyze and print statistics about the scraped data."""
-    total = len(data)
+    total = 0
+
+    # Gather every statistic in a single pass over the data
+    counts = Counter()
+    stage_counts = Counter()
+    city_counts = Counter()
+    industry_counts = Counter()
+    sector_counts = Counter()
+    connection_counts = Counter()
+    badge_counts = Counter()
+
+    for s in data:
+        total += 1
+        location = s.get("location") or _EMPTY
+        contact = s.get("contact") or _EMPTY
+
+        if s.get("cin"):
+            counts["cin"] += 1
+        if contact.get("email"):
+            counts["email"] += 1
+        if contact.get("phone"):
+            counts["phone"] += 1
+        if s.get("dippCertified"):
+            counts["dipp_certified"] += 1
+        if s.get("dippRecognitionStatus") == "RECOGNISED":
+            counts["recognised"] += 1
+        if s.get("funded"):
+            counts["funded"] += 1
+        if s.get("website"):
+            counts["website"] += 1
+        if s.get("linkedInUrl"):
+            counts["linkedin"] += 1
+
+        stage = s.get("stage")
+        if stage:
+            stage_counts[stage] += 1
+        city = location.get("city")
+        if city:
+            city_counts[city] += 1
+        industry = s.get("industry")
+        if industry:
+            industry_counts[industry] += 1
+
+        sector_counts.update(s.get("sectors") or ())
+        connection_counts.update(s.get("lookingToConnectTo") or ())
+        badge_counts.update(s.get("badges") or ())
+
+    if not total:
+        print("No data to analyze")
+        return
 
     print("=" * 70)
     print("STARTUP DATA ANALYSIS")
@@ -26,9 +87,9 @@ def analyze_data(data: List[Dict]):
     print(f"\nTotal Startups: {total}")
 
     # Contact information statistics
-    with_cin = sum(1 for s in data if s.get("cin"))
-    with_email = sum(1 for s in data if s.get("contact", {}).get("email"))
-    with_phone = sum(1 for s in data if s.get("contact", {}).get("phone"))
+    with_cin = counts["cin"]
+    with_email = counts["email"]
+    with_phone = counts["phone"]
 
     print("\n" + "-" * 70)
     print("CONTACT INFORMATION")
@@ -38,8 +99,8 @@ def analyze_data(data: List[Dict]):
     print(f"Startups with Phone: {with_phone} ({with_phone/total*100:.1f}%)")
 
     # Recognition status
-    dipp_certified = sum(1 for s in data if s.get("dippCertified"))
-    recognised = sum(1 for s in data if s.get("dippRecognitionStatus") == "RECOGNISED")
+    dipp_certified = counts["dipp_certified"]
+    recognised = counts["recognised"]
 
     print("\n" + "-" * 70)
     print("RECOGNITION STATUS")
@@ -48,13 +109,10 @@ def analyze_data(data: List[Dict]):
     print(f"DIPP Recognised: {recognised} ({recognised/total*100:.1f}%)")
 
     # Funding status
-    funded = sum(1 for s in data if s.get("funded"))
+    funded = counts["funded"]
     print(f"\nFunded Startups: {funded} ({funded/total*100:.1f}%)")
 
     # Stage distribution
-    stages = [s.get("stage") for s in data if s.get("stage")]
-    stage_counts = Counter(stages)
-
     print("\n" + "-" * 70)
     print("STAGE DISTRIBUTION")
     print("-" * 70)
@@ -62,13 +120,6 @@ def analyze_data(data: List[Dict]):
         print(f"{stage:20} : {count:4} ({count/total*100:.1f}%)")
 
     # Location distribution
-    cities = [
-        s.get("location", {}).get("city")
-        for s in data
-        if s.get("location", {}).get("city")
-    ]
-    city_counts = Counter(cities)
-
     print("\n" + "-" * 70)
     print("TOP 10 CITIES")
     print("-" * 70)
@@ -76,9 +127,6 @@ def analyze_data(data: List[Dict]):
         print(f"{city:20} : {count:4} ({count/total*100:.1f}%)")
 
     # Industry distribution
-    industries = [s.get("industry") for s in data if s.get("industry")]
-    industry_counts = Counter(industries)
-
     print("\n" + "-" * 70)
     print("TOP 10 INDUSTRIES")
     print("-" * 70)
@@ -86,12 +134,6 @@ def analyze_data(data: List[Dict]):
         print(f"{industry:30} : {count:4} ({count/total*100:.1f}%)")
 
     # Sector distribution
-    all_sectors = []
-    for s in data:
-        sectors = s.get("sectors", [])
-        all_sectors.extend(sectors)
-    sector_counts = Counter(all_sectors)
-
     print("\n" + "-" * 70)
     print("TOP 10 SECTORS")
     print("-" * 70)
@@ -99,13 +141,6 @@ def analyze_data(data: List[Dict]):
         print(f"{sector:40} : {count:4}")
 
     # Looking to connect
-    all_connections = []
-    for s in data:
-        connections = s.get("lookingToConnectTo", [])
-        if connections:  # Check if not None
-            all_connections.extend(connections)
-    connection_counts = Counter(all_connections)
-
     print("\n" + "-" * 70)
     print("LOOKING TO CONNECT TO")
     print("-" * 70)
@@ -113,13 +148,6 @@ def analyze_data(data: List[Dict]):
         print(f"{connection:15} : {count:4} ({count/total*100:.1f}%)")
 
     # Badges
-    all_badges = []
-    for s in data:
-        badges = s.get("badges", [])
-        if badges:  # Check if not None
-            all_badges.extend(badges)
-    badge_counts = Counter(all_badges)
-
     print("\n" + "-" * 70)
     print("BADGES")
     print("-" * 70)
@@ -127,8 +155,8 @@ def analyze_data(data: List[Dict]):
         print(f"{badge:20} : {count:4} ({count/total*100:.1f}%)")
 
     # Website/LinkedIn presence
-    with_website = sum(1 for s in data if s.get("website"))
-    with_linkedin = sum(1 for s in data if s.get("linkedInUrl"))
+    with_website = counts["website"]
+    with_linkedin = counts["linkedin"]
 
     print("\n" + "-" * 70)
     print("ONLINE PRESENCE")
@@ -139,42 +167,47 @@ def analyze_data(data: List[Dict]):
     print("\n" + "=" * 70)
 
 
-def export_filtered_data(data: List[Dict], filter_criteria: Dict, output_file: str):
+def export_filtered_data(data: Iterable[Dict], filter_criteria: Dict, output_file: str):
     """Export filtered data based on criteria."""
     filtered = data
 
+    # Chain the filters lazily so only matching records are kept in memory
     if "stage" in filter_criteria:
-        filtered = [s for s in filtered if s.get("stage") == filter_criteria["stage"]]
+        filtered = (s for s in filtered if s.get("stage") == filter_criteria["stage"])
 
     if "industry" in filter_criteria:
-        filtered = [
+        filtered = (
             s for s in filtered if s.get("industry") == filter_criteria["industry"]
-        ]
+        )
 
     if "city" in filter_criteria:
-        filtered = [
+        filtered = (
             s
             for s in filtered
-            if s.get("location", {}).get("city") == filter_criteria["city"]
-        ]
+            if (s.get("location") or _EMPTY).get("city") == filter_criteria["city"]
+        )
 
     if "funded" in filter_criteria:
-        filtered = [s for s in filtered if s.get("funded") == filter_criteria["funded"]]
+        filtered = (s for s in filtered if s.get("funded") == filter_criteria["funded"])
 
     if "has_email" in filter_criteria and filter_criteria["has_email"]:
-        filtered = [s for s in filtered if s.get("contact", {}).get("email")]
+        filtered = (s for s in filtered if (s.get("contact") or _EMPTY).get("email"))
+
+    filtered = list(filtered)
 
-    with open(output_file, "w") as f:
-        json.dump(filtered, f, indent=2, ensure_ascii=False)
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(filtered, option=orjson.OPT_INDENT_2))
 
     print(f"Exported {len(filtered)} startups to {output_file}")
 
 
-def export_to_csv(data: List[Dict], output_file: str = "startups_data.csv"):
+def export_to_csv(data: Iterable[Dict], output_file: str = "startups_data.csv"):
     """Export data to CSV format."""
     import csv
 
-    if not data:
+    data = iter(data)
+    first = next(data, None)
+    if first is None:
         print("No data to export")
         return
 
@@ -200,57 +233,62 @@ def export_to_csv(data: List[Dict], output_file: str = "startups_data.csv"):
         "incorporationDate",
     ]
 
+    # Rows are plain tuples in fieldnames order; csv.writer skips DictWriter's
+    # per-row dict-to-list conversion and key validation
     with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for startup in data:
-            row = {
-                "id": startup.get("id"),
-                "name": startup.get("name"),
-                "legalName": startup.get("legalName"),
-                "cin": startup.get("cin"),
-                "pan": startup.get("pan"),
-                "dippNumber": startup.get("dippNumber"),
-                "dippRecognitionStatus": startup.get("dippRecognitionStatus"),
-                "stage": startup.get("stage"),
-                "funded": startup.get("funded"),
-                "industry": startup.get("industry"),
-                "country": startup.get("location", {}).get("country"),
-                "state": startup.get("location", {}).get("state"),
-                "city": startup.get("location", {}).get("city"),
-                "email": startup.get("contact", {}).get("email"),
-                "phone": startup.get("contact", {}).get("phone"),
-                "website": startup.get("website"),
-                "linkedInUrl": startup.get("linkedInUrl"),
-                "companyStatus": startup.get("companyStatus"),
-                "incorporationDate": startup.get("incorporationDate"),
-            }
-            writer.writerow(row)
-
-    print(f"Exported {len(data)} startups to {output_file}")
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+
+        exported = 0
+        for startup in chain([first], data):
+            location = startup.get("location") or _EMPTY
+            contact = startup.get("contact") or _EMPTY
+            writer.writerow(
+                (
+                    startup.get("id"),
+                    startup.get("name"),
+                    startup.get("legalName"),
+                    startup.get("cin"),
+                    startup.get("pan"),
+                    startup.get("dippNumber"),
+                    startup.get("dippRecognitionStatus"),
+                    startup.get("stage"),
+                    startup.get("funded"),
+                    startup.get("industry"),
+                    location.get("country"),
+                    location.get("state"),
+                    location.get("city"),
+                    contact.get("email"),
+                    contact.get("phone"),
+                    startup.get("website"),
+                    startup.get("linkedInUrl"),
+                    startup.get("companyStatus"),
+                    startup.get("incorporationDate"),
+                )
+            )
+            exported += 1
+
+    print(f"Exported {exported} startups to {output_file}")
 
 
 def main():
     """Main entry point for data analysis."""
-    data_file = Path("startups_data.json")
+    data_file = Path("startups_data.jsonl")
 
     if not data_file.exists():
         print(f"Error: {data_file} not found!")
         print("Please run the scraper first: python startup_scraper.py")
         return
 
+    # Each step streams the file again rather than holding every record in memory
     print("Loading data...")
-    data = load_data()
-
-    # Display analysis
-    analyze_data(data)
+    analyze_data(iter_startups(data_file))
 
     # Optional: Export to CSV
     print("\n" + "=" * 70)
     response = input("\nExport to CSV? (y/n): ").strip().lower()
     if response == "y":
-        export_to_csv(data)
+        export_to_csv(iter_startups(data_file))
 
     # Optional: Export filtered data
     print("\n" + "=" * 70)
@@ -264,6 +302,7 @@ def main():
         print("5. With email only")
 
         choice = input("\nEnter filter number (or press Enter to skip): ").strip()
+        data = iter_startups(data_file)
 
         if choice == "1":
             stage = input("Enter stage: ").strip()
@@ -4,12 +4,17 @@ Startup India API Scraper
 Scrapes startup data from Startup India API with proper error handling and rate limiting.
 """
 
-import json
+import os
+import socket
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlparse
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -21,9 +26,11 @@ DEFAULT_CONFIG = {
     "cin_api_url": "https://api.startupindia.gov.in/sih/api/noauth/dpiit/services/cin/info",
     "state_id": "5f48ce592a9bb065cdf9fb25",  # Chhattisgarh
     "rate_limit_delay": 0.5,  # seconds between requests
+    "rate_limit_burst": 1,  # requests allowed back-to-back after idle time
     "retry_attempts": 3,
     "retry_backoff": 2,  # exponential backoff factor
     "checkpoint_interval": 50,  # save checkpoint every N items
+    "max_workers": 8,  # concurrent listing/detail/CIN fetches
     "scrape_all_states": False,
     "states": ["5f48ce592a9bb065cdf9fb25"],
 }
@@ -34,10 +41,10 @@ def load_config() -> Dict[str, Any]:
     config_file = Path("config.json")
     if config_file.exists():
         try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                logger.info("Loaded configuration from config.json")
-                return config
+            config = DEFAULT_CONFIG.copy()
+            config.update(orjson.loads(config_file.read_bytes()))
+            logger.info("Loaded configuration from config.json")
+            return config
         except Exception as e:
             logger.warning(f"Failed to load config.json: {e}. Using defaults.")
     return DEFAULT_CONFIG.copy()
@@ -52,15 +59,53 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class RateLimiter:
+    """Thread-safe token bucket shared by all worker threads.
+
+    Tokens refill at one per `delay` seconds, up to `burst` tokens. The
+    long-run request rate is 1/delay no matter how many workers are running,
+    while short idle gaps can be made up with a burst of up to `burst` calls.
+    """
+
+    def __init__(self, delay: float, burst: int = 1):
+        self.delay = delay
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def wait(self):
+        """Block until a token is available, then consume it."""
+        if self.delay <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed / self.delay)
+            self._updated = now
+            # Take the token now; a negative balance is time owed to the bucket
+            self._tokens -= 1
+            wait_time = -self._tokens * self.delay if self._tokens < 0 else 0
+
+        time.sleep(wait_time)
+
+
 class StartupScraper:
     """Main scraper class for Startup India data."""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self.rate_limiter = RateLimiter(
+            config["rate_limit_delay"], config["rate_limit_burst"]
+        )
         self.session = self._create_session()
         self.checkpoint_file = Path("checkpoint_ids.json")
         self.progress_file = Path("progress.json")
-        self.output_file = Path("startups_data.json")
+        self.output_file = Path("startups_data.jsonl")
+        self.cin_cache_file = Path("cin_cache.jsonl")
+        self.cin_cache = self._load_cin_cache()
+        self._cin_cache_lock = threading.Lock()
 
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry logic."""
@@ -86,14 +131,30 @@ class StartupScraper:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled connection per worker so concurrent requests reuse them
+        adapter = HTTPAdapter(
+            pool_maxsize=self.config["max_workers"], max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
 
+    def _warm_up(self):
+        """Resolve the API host and open a pooled connection before scraping."""
+        url = self.config["listing_api_url"]
+        parsed = urlparse(url)
+        host = parsed.hostname
+        try:
+            socket.getaddrinfo(host, parsed.port or 443)
+            # Any response will do: the point is the TCP/TLS handshake, after
+            # which the connection is kept alive in the pool for phase 1
+            self.session.head(url, timeout=5)
+        except (OSError, requests.exceptions.RequestException) as e:
+            logger.warning(f"Connection warm-up to {host} failed: {e}")
+
     def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        time.sleep(self.config["rate_limit_delay"])
+        """Apply rate limiting between requests (shared across threads)."""
+        self.rate_limiter.wait()
 
     def get_listing_page(self, page_num: int) -> Optional[Dict]:
         """Fetch a single page from the listing API."""
@@ -122,11 +183,13 @@ class StartupScraper:
         try:
             self._rate_limit()
             response = self.session.post(
-                self.config["listing_api_url"], json=payload, timeout=30
+                self.config["listing_api_url"],
+                data=orjson.dumps(payload),
+                timeout=30,
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching page {page_num}: {e}")
             return None
 
@@ -137,8 +200,7 @@ class StartupScraper:
         # Check if checkpoint exists
         if self.checkpoint_file.exists():
             logger.info("Loading startup IDs from checkpoint...")
-            with open(self.checkpoint_file, "r") as f:
-                return json.load(f)
+            return orjson.loads(self.checkpoint_file.read_bytes())
 
         startup_ids = []
 
@@ -160,23 +222,39 @@ class StartupScraper:
             f"Fetched page 0/{total_pages - 1}: {len(startup_ids)} startups so far"
         )
 
-        # Fetch remaining pages
-        for page_num in range(1, total_pages):
-            page_data = self.get_listing_page(page_num)
-            if page_data:
-                for startup in page_data.get("content", []):
-                    startup_ids.append(
-                        {"id": startup.get("id"), "name": startup.get("name")}
+        # Fetch remaining pages concurrently; map() yields them in page order
+        with ThreadPoolExecutor(max_workers=self.config["max_workers"]) as executor:
+            pages = executor.map(self.get_listing_page, range(1, total_pages))
+            for page_num, page_data in enumerate(pages, 1):
+                if page_data:
+                    for startup in page_data.get("content", []):
+                        startup_ids.append(
+                            {"id": startup.get("id"), "name": startup.get("name")}
+                        )
+                    logger.info(
+                        f"Fetched page {page_num}/{total_pages - 1}: {len(startup_ids)} startups so far"
                     )
-                logger.info(
-                    f"Fetched page {page_num}/{total_pages - 1}: {len(startup_ids)} startups so far"
-                )
-            else:
-                logger.warning(f"Skipping page {page_num} due to error")
+                else:
+                    logger.warning(f"Skipping page {page_num} due to error")
+
+        # The listing is sorted by registration date, so startups registering
+        # mid-scrape shift later pages and repeat entries; fetch each ID once
+        seen = set()
+        unique_ids = []
+        for startup_ref in startup_ids:
+            if startup_ref["id"] not in seen:
+                seen.add(startup_ref["id"])
+                unique_ids.append(startup_ref)
+        if len(unique_ids) < len(startup_ids):
+            logger.info(
+                f"Dropped {len(startup_ids) - len(unique_ids)} duplicate startup IDs"
+            )
+        startup_ids = unique_ids
 
         # Save checkpoint
-        with open(self.checkpoint_file, "w") as f:
-            json.dump(startup_ids, f, indent=2)
+        self.checkpoint_file.write_bytes(
+            orjson.dumps(startup_ids, option=orjson.OPT_INDENT_2)
+        )
         logger.info(
             f"Phase 1 complete: {len(startup_ids)} startup IDs saved to {self.checkpoint_file}"
         )
@@ -190,61 +268,78 @@ class StartupScraper:
             url = f"{self.config['details_api_url']}{startup_id}"
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching details for {startup_id}: {e}")
             return None
 
+    def _load_cin_cache(self) -> Dict[str, Dict]:
+        """Load cached CIN details from previous runs."""
+        cache = {}
+        if self.cin_cache_file.exists():
+            with open(self.cin_cache_file, "rb") as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # torn line from an interrupted run
+                    cache[entry["cin"]] = entry["data"]
+            logger.info(f"Loaded {len(cache)} cached CIN records")
+        return cache
+
+    def _cache_cin_details(self, cin: str, cin_details: Dict):
+        """Remember CIN details in memory and append them to the cache file."""
+        with self._cin_cache_lock:
+            if cin in self.cin_cache:
+                return  # another worker fetched the same CIN concurrently
+            self.cin_cache[cin] = cin_details
+            with open(self.cin_cache_file, "ab") as f:
+                f.write(orjson.dumps({"cin": cin, "data": cin_details}) + b"\n")
+
     def get_cin_details(self, cin: str) -> Optional[Dict]:
         """Fetch CIN details including contact information."""
         if not cin or cin == "null" or cin == "":
             return None
 
+        # CIN records rarely change, so cached details are reused across runs
+        cached = self.cin_cache.get(cin)
+        if cached is not None:
+            return cached
+
         try:
             self._rate_limit()
             response = self.session.get(
                 self.config["cin_api_url"], params={"cin": cin}, timeout=30
             )
             response.raise_for_status()
-            data = response.json()
-            if data.get("status"):
-                return data.get("data")
-            return None
-        except requests.exceptions.RequestException as e:
+            data = orjson.loads(response.content)
+            cin_details = data.get("data") if data.get("status") else None
+            if cin_details:
+                self._cache_cin_details(cin, cin_details)
+            return cin_details
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching CIN details for {cin}: {e}")
             return None
 
     def extract_startup_data(self, details: Dict, cin_details: Optional[Dict]) -> Dict:
         """Extract and structure relevant data from API responses."""
-        user = details.get("user", {})
-        startup = user.get("startup", {})
-        location = startup.get("location", {})
-        focus_area = startup.get("focusArea", {})
+        # Bind each nested level once; "or {}" also covers explicit nulls
+        user = details.get("user") or {}
+        startup = user.get("startup") or {}
+        location = startup.get("location") or {}
+        focus_area = startup.get("focusArea") or {}
 
         # Extract location info with null safety
-        country = (
-            location.get("country", {}).get("countryName")
-            if location.get("country")
-            else None
-        )
-        state = (
-            location.get("state", {}).get("stateName")
-            if location.get("state")
-            else None
-        )
-        city = (
-            location.get("city", {}).get("districtName")
-            if location.get("city")
-            else None
-        )
+        country = (location.get("country") or {}).get("countryName")
+        state = (location.get("state") or {}).get("stateName")
+        city = (location.get("city") or {}).get("districtName")
 
         # Extract industry and sectors with null safety
-        industry_obj = focus_area.get("industry") if focus_area else None
-        industry = industry_obj.get("industryName") if industry_obj else None
-
-        sectors_list = focus_area.get("sectors", []) if focus_area else []
+        industry = (focus_area.get("industry") or {}).get("industryName")
         sectors = [
-            s.get("sectionName") for s in sectors_list if s and s.get("sectionName")
+            s.get("sectionName")
+            for s in focus_area.get("sectors") or ()
+            if s and s.get("sectionName")
         ]
 
         # Build structured data
@@ -275,9 +370,10 @@ class StartupScraper:
 
         # Add CIN details if available
         if cin_details:
-            data["contact"]["email"] = cin_details.get("email")
-            data["contact"]["phone"] = cin_details.get("registeredContactNo")
-            data["contact"]["registeredAddress"] = cin_details.get("registeredAddress")
+            contact = data["contact"]
+            contact["email"] = cin_details.get("email")
+            contact["phone"] = cin_details.get("registeredContactNo")
+            contact["registeredAddress"] = cin_details.get("registeredAddress")
             data["companyStatus"] = cin_details.get("companyStatus")
             data["incorporationDate"] = cin_details.get("incorpdate")
 
@@ -286,81 +382,148 @@ class StartupScraper:
     def load_progress(self) -> Dict:
         """Load progress from file."""
         if self.progress_file.exists():
-            with open(self.progress_file, "r") as f:
-                return json.load(f)
+            return orjson.loads(self.progress_file.read_bytes())
         return {"processed_count": 0, "last_processed_id": None}
 
-    def save_progress(self, processed_count: int, last_id: str):
-        """Save progress to file."""
+    def save_progress(self, processed_count: int, last_id: str, output_size: int):
+        """Save progress to file.
+
+        `output_size` is the byte length of the output file at this checkpoint.
+        The file is replaced atomically, so a crash never leaves it half-written.
+        """
         progress = {
             "processed_count": processed_count,
             "last_processed_id": last_id,
+            "output_size": output_size,
             "timestamp": datetime.now().isoformat(),
         }
-        with open(self.progress_file, "w") as f:
-            json.dump(progress, f, indent=2)
+        tmp_file = self.progress_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(orjson.dumps(progress, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, self.progress_file)
+
+    def _truncate_output(self, output_size: Optional[int]):
+        """Drop output written after the last checkpoint (e.g. a torn final line)."""
+        if output_size is None or self.output_file.stat().st_size <= output_size:
+            return
+        logger.warning(
+            f"Discarding {self.output_file.stat().st_size - output_size} bytes "
+            f"written to {self.output_file} after the last checkpoint"
+        )
+        with open(self.output_file, "r+b") as f:
+            f.truncate(output_size)
+
+    def load_data(self) -> List[Dict]:
+        """Load previously scraped data from the JSON Lines output file."""
+        with open(self.output_file, "rb") as f:
+            return [orjson.loads(line) for line in f if line.strip()]
+
+    def append_data(self, f, data: List[Dict]) -> int:
+        """Append scraped records to the open output file, one JSON object per line.
+
+        Returns the file size once the records are safely on disk.
+        """
+        for startup_data in data:
+            f.write(orjson.dumps(startup_data) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+    def _fetch_startup(self, startup_ref: Dict[str, str]) -> Optional[Dict]:
+        """Fetch details and CIN info for one startup (runs in a worker thread)."""
+        startup_id = startup_ref["id"]
+        startup_name = startup_ref["name"]
+
+        # Fetch startup details
+        details = self.get_startup_details(startup_id)
+        if not details:
+            logger.warning(f"Skipping {startup_name} - failed to fetch details")
+            return None
+
+        # Extract CIN and fetch CIN details. Per-startup messages are DEBUG
+        # and guarded so their f-strings aren't built on normal INFO runs.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        cin = ((details.get("user") or {}).get("startup") or {}).get("cin")
+        cin_details = None
+        if cin:
+            if debug:
+                logger.debug(f"  Fetching CIN details for {cin}")
+            cin_details = self.get_cin_details(cin)
+            if debug:
+                if cin_details:
+                    logger.debug(f"  ✓ CIN details retrieved for {startup_name}")
+                else:
+                    logger.debug(f"  ✗ CIN details not available for {startup_name}")
+        elif debug:
+            logger.debug(f"  No CIN available for {startup_name}")
 
-    def save_data(self, data: List[Dict]):
-        """Save scraped data to JSON file."""
-        with open(self.output_file, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Data saved to {self.output_file}")
+        # Extract and structure data
+        return self.extract_startup_data(details, cin_details)
 
     def fetch_all_details(self, startup_ids: List[Dict[str, str]]) -> List[Dict]:
         """Fetch details and CIN info for all startups."""
         logger.info("Phase 2 & 3: Fetching detailed information and contact details...")
 
         all_data = []
-        progress = self.load_progress()
-        start_index = progress.get("processed_count", 0)
-
-        # Load existing data if resuming
-        if self.output_file.exists() and start_index > 0:
-            logger.info(f"Resuming from startup {start_index}...")
-            with open(self.output_file, "r") as f:
-                all_data = json.load(f)
+        done_ids = set()
+
+        # Load existing data if resuming, otherwise start a fresh output file
+        if self.output_file.exists() and self.progress_file.exists():
+            progress = self.load_progress()
+            self._truncate_output(progress.get("output_size"))
+            all_data = self.load_data()
+            done_ids = {startup_data["id"] for startup_data in all_data}
+            mode = "ab"
+        else:
+            mode = "wb"
 
+        # Skip startups already in the output by ID, so resuming doesn't depend
+        # on the listing order and startups that failed before are retried
+        pending = [ref for ref in startup_ids if ref["id"] not in done_ids]
         total = len(startup_ids)
+        start_index = total - len(pending)
+        if start_index:
+            logger.info(
+                f"Resuming: {len(done_ids)} startups already scraped, "
+                f"{len(pending)} remaining"
+            )
+        batch_size = self.config["checkpoint_interval"]
+
+        # Fetch in checkpoint-sized batches; map() keeps results in input order.
+        # Each batch is appended to the output, so checkpoints cost O(batch).
+        debug = logger.isEnabledFor(logging.DEBUG)
+        phase_start = time.time()
+        with open(self.output_file, mode) as f, ThreadPoolExecutor(
+            max_workers=self.config["max_workers"]
+        ) as executor:
+            for batch_start in range(0, len(pending), batch_size):
+                batch = pending[batch_start : batch_start + batch_size]
+                if debug:
+                    for i, startup_ref in enumerate(batch, start_index + batch_start):
+                        logger.debug(
+                            f"Processing {i + 1}/{total}: {startup_ref['name']} ({startup_ref['id']})"
+                        )
+
+                batch_data = [
+                    startup_data
+                    for startup_data in executor.map(self._fetch_startup, batch)
+                    if startup_data
+                ]
+                all_data.extend(batch_data)
+
+                # Save checkpoint after each batch
+                processed = start_index + batch_start + len(batch)
+                output_size = self.append_data(f, batch_data)
+                self.save_progress(processed, batch[-1]["id"], output_size)
+                rate = (processed - start_index) / (time.time() - phase_start)
+                logger.info(
+                    f"Checkpoint saved at {processed}/{total} ({rate:.1f} startups/s)"
+                )
 
-        for i in range(start_index, total):
-            startup_ref = startup_ids[i]
-            startup_id = startup_ref["id"]
-            startup_name = startup_ref["name"]
-
-            logger.info(f"Processing {i + 1}/{total}: {startup_name} ({startup_id})")
-
-            # Fetch startup details
-            details = self.get_startup_details(startup_id)
-            if not details:
-                logger.warning(f"Skipping {startup_name} - failed to fetch details")
-                continue
-
-            # Extract CIN and fetch CIN details
-            cin = details.get("user", {}).get("startup", {}).get("cin")
-            cin_details = None
-            if cin:
-                logger.info(f"  Fetching CIN details for {cin}")
-                cin_details = self.get_cin_details(cin)
-                if cin_details:
-                    logger.info(f"  ✓ CIN details retrieved")
-                else:
-                    logger.info(f"  ✗ CIN details not available")
-            else:
-                logger.info(f"  No CIN available")
-
-            # Extract and structure data
-            startup_data = self.extract_startup_data(details, cin_details)
-            all_data.append(startup_data)
-
-            # Save checkpoint periodically
-            if (i + 1) % self.config["checkpoint_interval"] == 0:
-                self.save_data(all_data)
-                self.save_progress(i + 1, startup_id)
-                logger.info(f"Checkpoint saved at {i + 1}/{total}")
-
-        # Final save
-        self.save_data(all_data)
-        self.save_progress(total, startup_ids[-1]["id"] if startup_ids else None)
+        self.save_progress(
+            total,
+            startup_ids[-1]["id"] if startup_ids else None,
+            self.output_file.stat().st_size,
+        )
         logger.info(f"Phase 2 & 3 complete: {len(all_data)} startups processed")
 
         return all_data
@@ -371,6 +534,7 @@ class StartupScraper:
         logger.info("Starting Startup India Scraper")
         logger.info("=" * 60)
         start_time = time.time()
+        self._warm_up()
 
         # Phase 1: Fetch all startup IDs
         startup_ids = self.fetch_all_startup_ids()